@@ -3,11 +3,12 @@
 __version__ = "1.0.0"
 __author__ = "Your Name"
 
-from .html_generator import create_task_image, create_todolist_image
+from .html_generator import create_task_image, create_task_images, create_todolist_image
 from .printer import print_to_thermal_printer
 
 __all__ = [
     "create_task_image",
+    "create_task_images",
     "create_todolist_image",
     "print_to_thermal_printer",
 ]
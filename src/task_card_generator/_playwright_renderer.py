@@ -0,0 +1,102 @@
+"""Playwright-backed HTML renderer with a long-lived headless Chromium.
+
+Playwright's sync API is bound to the thread that started it, so the browser
+lives on a dedicated worker thread and every render is submitted to it. The
+browser exits together with the Playwright driver process at shutdown.
+"""
+
+import logging
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    from playwright.sync_api import sync_playwright
+    PLAYWRIGHT_AVAILABLE = True
+except ImportError:
+    PLAYWRIGHT_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+VIEWPORT = {"width": 576, "height": 800}
+
+_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="playwright")
+_playwright = None
+_browser = None
+# Set once no Chromium could be launched, so later renders skip straight to other backends
+_launch_failed = False
+
+
+def is_usable():
+    """Whether Playwright is installed and has not already failed to launch a browser."""
+    return PLAYWRIGHT_AVAILABLE and not _launch_failed
+
+
+def _launch_browser():
+    if _playwright is None:
+        raise RuntimeError("Playwright driver is not running")
+    logger.info("Launching shared Playwright Chromium")
+    try:
+        return _playwright.chromium.launch(headless=True)
+    except Exception:
+        # Use the system Chromium only when Playwright's bundled browser will not start
+        chromium_bin = shutil.which("chromium") or shutil.which("chromium-browser")
+        if not chromium_bin:
+            raise
+        logger.warning("Bundled Chromium unavailable; falling back to %s", chromium_bin)
+        return _playwright.chromium.launch(headless=True, executable_path=chromium_bin)
+
+
+def _get_browser():
+    """Return the shared Chromium instance; only call from the worker thread."""
+    global _playwright, _browser, _launch_failed
+    if _browser is None or not _browser.is_connected():
+        try:
+            if _playwright is None:
+                _playwright = sync_playwright().start()
+            _browser = _launch_browser()
+        except Exception:
+            logger.warning("Could not launch Chromium; disabling Playwright rendering")
+            _launch_failed = True
+            raise
+    return _browser
+
+
+def _render(html_content):
+    context = _get_browser().new_context(viewport=VIEWPORT)
+    try:
+        page = context.new_page()
+        # set_content skips navigation; "load" also covers the inline attachment image
+        page.set_content(html_content, wait_until="load")
+        return page.locator(".ticket-container").screenshot(type="png", omit_background=False)
+    finally:
+        context.close()
+
+
+def render(html_content):
+    """Render HTML and return the ``.ticket-container`` screenshot as PNG bytes."""
+    if not is_usable():
+        raise RuntimeError("Playwright is not installed or could not launch Chromium")
+    return _EXECUTOR.submit(_render, html_content).result()
+
+
+def _render_batch(html_content, batch_selector, measure_script):
+    context = _get_browser().new_context(viewport=VIEWPORT)
+    try:
+        page = context.new_page()
+        page.set_content(html_content, wait_until="load")
+        offsets = page.evaluate(f"() => {{ {measure_script} }}")
+        png = page.locator(batch_selector).screenshot(type="png", omit_background=False)
+        return png, offsets
+    finally:
+        context.close()
+
+
+def render_batch(html_content, batch_selector, measure_script):
+    """Screenshot ``batch_selector`` once and return ``(png_bytes, offsets)``.
+
+    ``measure_script`` is a JavaScript function body whose return value is
+    passed back as ``offsets``.
+    """
+    if not is_usable():
+        raise RuntimeError("Playwright is not installed or could not launch Chromium")
+    return _EXECUTOR.submit(_render_batch, html_content, batch_selector, measure_script).result()
@@ -1,16 +1,27 @@
 """HTML to image generation for task cards."""
 
-import base64
+import atexit
+import binascii
+import functools
+import hashlib
 import html
+import json
 import logging
 import os
 import shutil
 import tempfile
+import threading
+from collections import OrderedDict
 from io import BytesIO
+from pathlib import Path
+from string import Template
 from urllib.parse import quote
 from datetime import datetime
 
 from dotenv import load_dotenv
+from PIL import Image, ImageOps
+
+from . import _playwright_renderer
 
 load_dotenv()
 
@@ -20,30 +31,123 @@ logger = logging.getLogger(__name__)
 TICKET_PADDING_TOP = int(os.getenv("TICKET_PADDING_TOP", "0"))
 TICKET_PADDING_RIGHT = int(os.getenv("TICKET_PADDING_RIGHT", "8"))
 
+# Task card markup is compiled once; padding is fixed per process so it is baked in here
+_TASK_TEMPLATE = Template(
+    Template(
+        (Path(__file__).parent / "task_card.html.tmpl").read_text(encoding="utf-8")
+    ).safe_substitute(
+        TICKET_PADDING_TOP=TICKET_PADDING_TOP,
+        TICKET_PADDING_RIGHT=TICKET_PADDING_RIGHT,
+        SIGNATURE_RIGHT=TICKET_PADDING_RIGHT + 6,
+    )
+)
+_SIGNATURE_TEMPLATE = Template('<div class="operator-signature">BY $signature</div>')
+_ATTACHMENT_TEMPLATE = Template('<div class="attachment"><img src="$data_uri" alt="Attachment" /></div>')
+
 try:
     import imgkit
     IMGKIT_AVAILABLE = True
 except ImportError:
     IMGKIT_AVAILABLE = False
 
+# Resolve wkhtmltoimage once; Windows installs usually live outside PATH
+_WKHTMLTOIMAGE_PATHS = [
+    r'C:\Program Files\wkhtmltopdf\bin\wkhtmltoimage.exe',
+    r'C:\Program Files (x86)\wkhtmltopdf\bin\wkhtmltoimage.exe',
+    r'C:\wkhtmltopdf\bin\wkhtmltoimage.exe'
+]
+_WKHTML_CONFIG = None
+_WKHTML_AVAILABLE = False
+if IMGKIT_AVAILABLE:
+    _wkhtml_path = next((path for path in _WKHTMLTOIMAGE_PATHS if os.path.exists(path)), None)
+    if _wkhtml_path:
+        _WKHTML_CONFIG = imgkit.config(wkhtmltoimage=_wkhtml_path)
+    _WKHTML_AVAILABLE = _WKHTML_CONFIG is not None or shutil.which("wkhtmltoimage") is not None
+
+# Whether wkhtmltoimage actually renders here; refined by the opt-in startup probe below
+_IMGKIT_WORKS = _WKHTML_AVAILABLE
+
 try:
     from selenium import webdriver
     from selenium.webdriver.chrome.options import Options
     from selenium.webdriver.common.by import By
-    import time
+    from selenium.webdriver.support.ui import WebDriverWait
+    from selenium.common.exceptions import TimeoutException, WebDriverException
     SELENIUM_AVAILABLE = True
 except ImportError:
     SELENIUM_AVAILABLE = False
 
+# Headless Chrome is expensive to launch, so one driver is shared across renders
+_DRIVER = None
+_DRIVER_LOCK = threading.Lock()
+
+# Rendered task card PNGs keyed by their inputs, so identical tickets skip the browser
+RENDER_CACHE_SIZE = 32
+_render_cache = OrderedDict()
+_render_cache_lock = threading.Lock()
+
+
+def _sniff_image_type(data):
+    """Guess the image subtype from magic bytes, defaulting to PNG."""
+    if data[:8] == b"\x89PNG\r\n\x1a\n":
+        return "png"
+    if data[:3] == b"\xff\xd8\xff":
+        return "jpeg"
+    if data[:6] in (b"GIF87a", b"GIF89a"):
+        return "gif"
+    if data[:4] == b"RIFF" and data[8:12] == b"WEBP":
+        return "webp"
+    if data[:2] == b"BM":
+        return "bmp"
+    return "png"
+
+
+# The attachment renders at most ~560px wide and 720px tall on the ticket
+ATTACHMENT_MAX_SIZE = (560, 720)
+
+
+def _shrink_attachment(attachment_bytes):
+    """Downscale an attachment to its printed size as grayscale JPEG.
+
+    Returns ``(image_type, image_bytes)``; undecodable input is returned as-is.
+    """
+    try:
+        with Image.open(BytesIO(attachment_bytes)) as img:
+            # JPEGs decode straight to a downscaled grayscale raster; the bound
+            # is square because EXIF rotation may still swap the axes
+            bound = max(ATTACHMENT_MAX_SIZE)
+            img.draft("L", (bound, bound))
+            img = ImageOps.exif_transpose(img)
+            if img.mode in ("RGBA", "LA", "P") and (img.mode != "P" or "transparency" in img.info):
+                # Flatten transparency onto white paper instead of black
+                rgba = img.convert("RGBA")
+                img = Image.new("RGBA", rgba.size, "white")
+                img.alpha_composite(rgba)
+            img = img.convert("L")
+            img.thumbnail(ATTACHMENT_MAX_SIZE, Image.LANCZOS)
+            buf = BytesIO()
+            img.save(buf, format="JPEG", quality=80)
+            return "jpeg", buf.getvalue()
+    except Exception:
+        logger.warning("Could not decode attachment; embedding original bytes")
+        return _sniff_image_type(attachment_bytes), attachment_bytes
+
+
+_PRIORITY_DOTS = {1: "★ ★ ★", 2: "★ ★", 3: "★"}
+_PRIORITY_DOTS_BY_NAME = {"HIGH": _PRIORITY_DOTS[1], "MEDIUM": _PRIORITY_DOTS[2]}
+
+
+@functools.lru_cache(maxsize=64)
+def _format_due_date(due_date):
+    """Parse an ISO date string and show it as MM/DD for compact tickets."""
+    return datetime.fromisoformat(due_date.replace('Z', '+00:00')).strftime('%m/%d')
+
 
 def create_task_html(task):
     """Create HTML content for task card with ticket-style design."""
     # Use the due_date from task if it's a Task object, otherwise use current date
     if hasattr(task, 'due_date'):
-        # Parse ISO format date string and show as MM/DD for compact tickets
-        from datetime import datetime as dt
-        due_date_obj = dt.fromisoformat(task.due_date.replace('Z', '+00:00'))
-        due_date_text = due_date_obj.strftime('%m/%d')
+        due_date_text = _format_due_date(task.due_date)
     else:
         # Fallback for dict format
         due_date_text = datetime.now().strftime("%m/%d")
@@ -63,206 +167,57 @@ def create_task_html(task):
     attachment_data_uri = None
     if attachment_bytes:
         try:
-            image_type = "png"
-            try:
-                from PIL import Image
-                with Image.open(BytesIO(attachment_bytes)) as img:
-                    if img.format:
-                        image_type = img.format.lower()
-            except Exception:
-                image_type = "png"
-            encoded = base64.b64encode(attachment_bytes).decode("ascii")
+            image_type, attachment_bytes = _shrink_attachment(attachment_bytes)
+            encoded = binascii.b2a_base64(attachment_bytes, newline=False).decode("ascii")
             attachment_data_uri = f"data:image/{image_type};base64,{encoded}"
         except Exception:
             attachment_data_uri = None
     
-    # Priority indicator - handle both Task object and dict
+    # Priority indicator - handle both Task object (numeric) and dict (named)
     if hasattr(task, 'priority'):
-        # Task object with numeric priority
-        priority_map = {1: ("★ ★ ★", "HIGH PRIORITY"),
-                       2: ("★ ★", "MEDIUM PRIORITY"),
-                       3: ("★", "LOW PRIORITY")}
-        priority_dots, priority_text = priority_map.get(task.priority, ("★ ★", "MEDIUM PRIORITY"))
+        priority_dots = _PRIORITY_DOTS.get(task.priority, _PRIORITY_DOTS[2])
     else:
-        # Dict format with string priority
-        if task["priority"].upper() == "HIGH":
-            priority_dots = "★ ★ ★"
-            priority_text = "HIGH PRIORITY"
-        elif task["priority"].upper() == "MEDIUM":
-            priority_dots = "★ ★"
-            priority_text = "MEDIUM PRIORITY"
-        else:
-            priority_dots = "★"
-            priority_text = "LOW PRIORITY"
-    
-    html_content = f"""
-    <!DOCTYPE html>
-    <html>
-    <head>
-        <meta charset="UTF-8">
-        <style>
-            * {{
-                margin: 0;
-                padding: 0;
-                box-sizing: border-box;
-            }}
-            
-            body {{
-                font-family: 'Noto Sans CJK TC', 'Noto Sans CJK SC', 'Noto Color Emoji', 'Microsoft JhengHei UI', 'Segoe UI', Arial, sans-serif;
-                background-color: white;
-                width: 576px;
-                padding: 0;
-                margin: 0;
-            }}
-            
-            .ticket-container {{
-                background: white;
-                padding: {TICKET_PADDING_TOP}px {TICKET_PADDING_RIGHT}px 0 0;
-                position: relative;
-            }}
-            
-            .header {{
-                text-align: center;
-                margin-bottom: 3px;
-            }}
-            
-            .ticket-label {{
-                font-size: 24px;
-                font-weight: bold;
-                letter-spacing: 4px;
-                color: #000;
-                margin-bottom: 16px;
-            }}
-            
-            
-            .priority-dots {{
-                font-size: 48px;
-                font-weight: bold;
-                margin-top: 4px;
-                color: #000;
-                font-family: 'Segoe UI Emoji', 'Segoe UI Symbol', 'Apple Color Emoji', 'Noto Color Emoji', 'Segoe UI', Arial, sans-serif;
-            }}
+        priority_dots = _PRIORITY_DOTS_BY_NAME.get(task["priority"].upper(), _PRIORITY_DOTS[3])
 
-            .operator-signature {{
-                position: absolute;
-                top: 6px;
-                right: {TICKET_PADDING_RIGHT + 6}px;
-                font-size: 16px;
-                font-weight: 600;
-                color: #111;
-                letter-spacing: 0.5px;
-                text-transform: uppercase;
-                white-space: nowrap;
-            }}
-            
-            .perforation {{
-                background: repeating-linear-gradient(
-                    to right,
-                    #000 0,
-                    #000 6px,
-                    transparent 6px,
-                    transparent 12px
-                );
-                height: 3px;
-                margin: 3px 0;
-            }}
-            
-            .task-title {{
-                text-align: center;
-                padding: 8px 0;
-            }}
-            
-            .task-title h1 {{
-                font-size: 48px;
-                font-weight: bold;
-                line-height: 1.2;
-                color: #000;
-                word-wrap: break-word;
-                max-width: 100%;
-                overflow-wrap: break-word;
-                hyphens: auto;
-                margin: 0;
-                padding: 0 10px;
-            }}
-            
-            .dashed-line {{
-                border-top: 3px dashed #666;
-                margin: 4px 0;
-            }}
-            
-            .due-date {{
-                text-align: center;
-            }}
-            
-            
-            .due-date-text {{
-                font-size: 32px;
-                font-weight: bold;
-                color: #000;
-                margin-top: 2px;
-            }}
+    return _TASK_TEMPLATE.substitute(
+        signature_block=(
+            _SIGNATURE_TEMPLATE.substitute(signature=operator_signature_safe)
+            if operator_signature_safe else ""
+        ),
+        priority_dots=priority_dots,
+        title=task.name if hasattr(task, 'name') else task["title"],
+        due_date=due_date_text,
+        attachment_block=(
+            _ATTACHMENT_TEMPLATE.substitute(data_uri=attachment_data_uri)
+            if attachment_data_uri else ""
+        ),
+    )
 
-            .attachment {{
-                margin-top: 8px;
-                text-align: center;
-                padding: 0 6px;
-            }}
-            .attachment img {{
-                width: 100%;
-                max-width: 100%;
-                max-height: 720px;
-                border-radius: 6px;
-                border: 2px dashed #666;
-                object-fit: contain;
-                display: block;
-                margin: 0 auto;
-            }}
-            
-            .bottom-perforation {{
-                margin-top: 4px;
-            }}
-            
-        </style>
-    </head>
-    <body>
-        <div class="ticket-container">
-            {"<div class=\"operator-signature\">BY " + operator_signature_safe + "</div>" if operator_signature_safe else ""}
-            <!-- Lightning Bolts Only -->
-            <div class="header">
-                <div class="priority-dots">{priority_dots}</div>
-            </div>
-            
-            <!-- Task Title -->
-            <div class="task-title">
-                <h1>{task.name if hasattr(task, 'name') else task["title"]}</h1>
-            </div>
-            
-            <!-- Dashed Separator -->
-            <div class="dashed-line"></div>
-            
-            <!-- Due Date Section -->
-            <div class="due-date">
-                <div class="due-date-text">{due_date_text}</div>
-            </div>
-            
-            <!-- Attachment -->
-            {f'<div class="attachment"><img src=\"{attachment_data_uri}\" alt=\"Attachment\" /></div>' if attachment_data_uri else ''}
-            
-            <!-- Bottom Perforation -->
-            <div class="perforation bottom-perforation"></div>
-        </div>
-    </body>
-    </html>
-    """
-    
-    return html_content
+
+def _write_temp_png(img_bytes):
+    """Write PNG bytes to a retained temporary file and return its path."""
+    temp_img = tempfile.NamedTemporaryFile(delete=False, suffix=".png")
+    with temp_img:
+        temp_img.write(img_bytes)
+    return temp_img.name
+
+
+def _imgkit_usable():
+    """Whether ``html_to_image_imgkit`` would attempt a render."""
+    return IMGKIT_AVAILABLE and _WKHTML_AVAILABLE and _IMGKIT_WORKS
 
 
-def html_to_image_imgkit(html_content, retain_file=True):
+def html_to_image_imgkit(html_content, retain_file=False):
     """Convert HTML to image using imgkit (requires wkhtmltopdf)."""
     if not IMGKIT_AVAILABLE:
         logger.info("imgkit unavailable; skipping wkhtmltoimage conversion")
         return None, None
+    if not _WKHTML_AVAILABLE:
+        logger.info("wkhtmltoimage not found; skipping imgkit conversion")
+        return None, None
+    if not _IMGKIT_WORKS:
+        logger.info("wkhtmltoimage failed the startup probe; skipping imgkit conversion")
+        return None, None
     logger.info("Rendering task card via imgkit/wkhtmltoimage")
     
     try:
@@ -275,31 +230,14 @@ def html_to_image_imgkit(html_content, retain_file=True):
             'crop-w': 576,  # Crop to exact width
         }
 
-        # Try to configure wkhtmltopdf path for Windows
-        config = None
-        import os
-        possible_paths = [
-            r'C:\Program Files\wkhtmltopdf\bin\wkhtmltoimage.exe',
-            r'C:\Program Files (x86)\wkhtmltopdf\bin\wkhtmltoimage.exe',
-            r'C:\wkhtmltopdf\bin\wkhtmltoimage.exe'
-        ]
-
-        for path in possible_paths:
-            if os.path.exists(path):
-                config = imgkit.config(wkhtmltoimage=path)
-                break
-
-        # Convert HTML to image, returning either a file or bytes
-        if retain_file:
-            temp_img = tempfile.NamedTemporaryFile(delete=False, suffix=".png")
-            temp_img.close()
-            imgkit.from_string(html_content, temp_img.name, options=options, config=config)
-            with open(temp_img.name, "rb") as f:
-                img_bytes = f.read()
-            logger.info("Task card rendered via imgkit: %s", temp_img.name)
-            return temp_img.name, img_bytes
+        config = _WKHTML_CONFIG
 
+        # Always render to bytes; only write a file afterwards when asked to keep one
         img_bytes = imgkit.from_string(html_content, False, options=options, config=config)
+        if retain_file:
+            image_path = _write_temp_png(img_bytes)
+            logger.info("Task card rendered via imgkit: %s", image_path)
+            return image_path, img_bytes
         return None, img_bytes
 
     except Exception as e:
@@ -307,17 +245,104 @@ def html_to_image_imgkit(html_content, retain_file=True):
         return None, None
 
 
-def html_to_image_selenium(html_content, retain_file=True):
-    """Convert HTML to image using Selenium (requires Chrome/ChromeDriver)."""
-    if not SELENIUM_AVAILABLE:
-        logger.info("Selenium unavailable; skipping webdriver conversion")
-        return None, None
-    logger.info("Rendering task card via Selenium screenshot")
-    
+# Per-user cache, so other local users cannot plant or redirect the probe result
+_PROBE_CACHE_PATH = (
+    Path(os.getenv("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"))
+    / "task_card_generator"
+    / "renderer_probe.json"
+)
+_PROBE_TIMEOUT = 2
+
+
+def _wkhtml_fingerprint():
+    """Identify the installed wkhtmltoimage so cached probe results expire on upgrade."""
+    path = _WKHTML_CONFIG.wkhtmltoimage if _WKHTML_CONFIG is not None else shutil.which("wkhtmltoimage")
+    try:
+        return f"{path}:{os.path.getmtime(path)}"
+    except (OSError, TypeError):
+        return str(path)
+
+
+def _read_probe_cache():
+    """Return the cached probe result, ignoring files this user does not own."""
+    fd = os.open(_PROBE_CACHE_PATH, os.O_RDONLY | getattr(os, "O_NOFOLLOW", 0))
+    with os.fdopen(fd) as f:
+        if hasattr(os, "getuid") and os.fstat(f.fileno()).st_uid != os.getuid():
+            return None
+        return json.load(f)
+
+
+def _write_probe_cache(data):
+    """Atomically replace the probe cache via a freshly created temp file."""
+    _PROBE_CACHE_PATH.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=_PROBE_CACHE_PATH.parent, suffix=".tmp")
     try:
-        # Configure Chrome options
+        with os.fdopen(fd, "w") as f:
+            json.dump(data, f)
+        os.replace(tmp_path, _PROBE_CACHE_PATH)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def _probe_imgkit():
+    """Render a blank page once to learn whether wkhtmltoimage works on this host.
+
+    The result is cached per user so later process starts skip the probe.
+    """
+    fingerprint = _wkhtml_fingerprint()
+    try:
+        cached = _read_probe_cache()
+        if cached is not None and cached.get("wkhtmltoimage") == fingerprint:
+            return bool(cached["imgkit_works"])
+    except (OSError, ValueError, KeyError, AttributeError):
+        pass
+
+    outcome = {}
+
+    def render():
+        try:
+            outcome["bytes"] = imgkit.from_string(
+                "<html><body></body></html>", False, options={"quiet": ""}, config=_WKHTML_CONFIG
+            )
+        except Exception:
+            logger.info("wkhtmltoimage probe render failed", exc_info=True)
+
+    # A daemon thread so a hung wkhtmltoimage cannot block startup or shutdown
+    probe = threading.Thread(target=render, name="imgkit-probe", daemon=True)
+    probe.start()
+    probe.join(_PROBE_TIMEOUT)
+    works = bool(outcome.get("bytes"))
+    if probe.is_alive():
+        # A slow first run (e.g. fontconfig building its cache) is not a verdict; retry next start
+        logger.info("wkhtmltoimage probe timed out; not caching the result")
+        return works
+
+    try:
+        _write_probe_cache({"wkhtmltoimage": fingerprint, "imgkit_works": works})
+    except OSError:
+        logger.debug("Could not persist renderer probe result", exc_info=True)
+    return works
+
+
+if _WKHTML_AVAILABLE and os.getenv("TASK_CARD_PROBE_RENDERERS", "0").lower() in {"1", "true", "yes"}:
+    _IMGKIT_WORKS = _probe_imgkit()
+    logger.info("Renderer probe: wkhtmltoimage %s", "works" if _IMGKIT_WORKS else "unusable")
+
+
+def _get_driver():
+    """Return the shared Chrome webdriver, launching it on first use.
+
+    Callers must hold ``_DRIVER_LOCK``.
+    """
+    global _DRIVER
+    if _DRIVER is None:
         chrome_options = Options()
-        chrome_options.add_argument('--headless')
+        chrome_options.add_argument('--headless=new')
+        chrome_options.add_argument('--disable-gpu')
+        # Keep headless tabs from being throttled, which can stall screenshots
+        chrome_options.add_argument('--disable-renderer-backgrounding')
+        chrome_options.add_argument('--disable-backgrounding-occluded-windows')
         chrome_options.add_argument('--no-sandbox')
         chrome_options.add_argument('--disable-dev-shm-usage')
         chrome_options.add_argument('--window-size=576,800')  # Tall enough to capture content
@@ -325,37 +350,81 @@ def html_to_image_selenium(html_content, retain_file=True):
         chromium_bin = shutil.which("chromium") or shutil.which("chromium-browser")
         if chromium_bin:
             chrome_options.binary_location = chromium_bin
+        logger.info("Launching shared Chrome webdriver")
+        _DRIVER = webdriver.Chrome(options=chrome_options)
+    return _DRIVER
+
+
+def _reset_driver():
+    """Discard the shared webdriver (e.g. after a crash). Callers must hold ``_DRIVER_LOCK``."""
+    global _DRIVER
+    if _DRIVER is not None:
+        try:
+            _DRIVER.quit()
+        except Exception:
+            logger.debug("Ignoring error while quitting webdriver", exc_info=True)
+        _DRIVER = None
+
+
+@atexit.register
+def _shutdown_driver():
+    with _DRIVER_LOCK:
+        _reset_driver()
+
+
+def _load_ticket_page(driver, url):
+    """Load ``url`` in ``driver`` and wait for it to settle."""
+    driver.get(url)
+
+    # The page is static, so wait only until the DOM, fonts and images are ready
+    wait = WebDriverWait(driver, 2)
+    try:
+        wait.until(lambda d: d.execute_script("return document.readyState") == "complete")
+        wait.until(lambda d: d.execute_script(
+            "return document.fonts ? document.fonts.status === 'loaded' : true"
+        ))
+        wait.until(lambda d: d.execute_script(
+            "return Array.from(document.images).every(img => img.complete && img.naturalWidth > 0)"
+        ))
+    except TimeoutException:
+        # A broken attachment never reports a width; capture what rendered
+        logger.warning("Timed out waiting for ticket page to settle; capturing anyway")
+
+
+def _screenshot_ticket(driver, url):
+    """Load ``url`` in ``driver`` and capture the ticket container as PNG bytes."""
+    _load_ticket_page(driver, url)
+    return driver.find_element(By.CLASS_NAME, "ticket-container").screenshot_as_png
+
+
+def _with_driver(capture, url):
+    """Run ``capture(driver, url)`` on the shared webdriver, relaunching it once if it died."""
+    with _DRIVER_LOCK:
+        try:
+            return capture(_get_driver(), url)
+        except WebDriverException:
+            # The browser may have crashed or been killed; relaunch once
+            logger.warning("Webdriver failed; relaunching Chrome and retrying", exc_info=True)
+            _reset_driver()
+            return capture(_get_driver(), url)
+
+
+def html_to_image_selenium(html_content, retain_file=False):
+    """Convert HTML to image using Selenium (requires Chrome/ChromeDriver)."""
+    if not SELENIUM_AVAILABLE:
+        logger.info("Selenium unavailable; skipping webdriver conversion")
+        return None, None
+    logger.info("Rendering task card via Selenium screenshot")
+    
+    try:
+        url = f"data:text/html;charset=utf-8,{quote(html_content)}"
+
+        img_bytes = _with_driver(_screenshot_ticket, url)
 
-        # Create webdriver
-        driver = webdriver.Chrome(options=chrome_options)
-        
-        if retain_file:
-            # Create temporary HTML file
-            temp_html = tempfile.NamedTemporaryFile(delete=False, suffix=".html", mode='w', encoding='utf-8')
-            temp_html.write(html_content)
-            temp_html.close()
-            driver.get(f'file://{temp_html.name}')
-        else:
-            driver.get(f"data:text/html;charset=utf-8,{quote(html_content)}")
-        
-        # Wait for page to load
-        time.sleep(1)
-        
-        # Get the ticket container element
-        ticket_element = driver.find_element(By.CLASS_NAME, "ticket-container")
-        
         if retain_file:
-            temp_img = tempfile.NamedTemporaryFile(delete=False, suffix=".png")
-            temp_img.close()
-            ticket_element.screenshot(temp_img.name)
-            with open(temp_img.name, "rb") as f:
-                img_bytes = f.read()
-            driver.quit()
-            logger.info("Task card rendered via Selenium: %s", temp_img.name)
-            return temp_img.name, img_bytes
-
-        img_bytes = ticket_element.screenshot_as_png
-        driver.quit()
+            image_path = _write_temp_png(img_bytes)
+            logger.info("Task card rendered via Selenium: %s", image_path)
+            return image_path, img_bytes
         return None, img_bytes
         
     except Exception as e:
@@ -363,23 +432,209 @@ def html_to_image_selenium(html_content, retain_file=True):
         return None, None
 
 
+def html_to_image_playwright(html_content, retain_file=False):
+    """Convert HTML to image using Playwright (requires a Chromium build)."""
+    if not _playwright_renderer.is_usable():
+        logger.info("Playwright unavailable; skipping Playwright conversion")
+        return None, None
+    logger.info("Rendering task card via Playwright screenshot")
+
+    try:
+        img_bytes = _playwright_renderer.render(html_content)
+        if retain_file:
+            image_path = _write_temp_png(img_bytes)
+            logger.info("Task card rendered via Playwright: %s", image_path)
+            return image_path, img_bytes
+        return None, img_bytes
+
+    except Exception as e:
+        logger.exception("Playwright conversion failed")
+        return None, None
+
+
+def _render_html(html_content, retain_file, label):
+    """Render HTML with the first backend that succeeds: Playwright, imgkit, Selenium."""
+    logger.info("Starting %s image render; retain_file=%s", label, retain_file)
+    for backend_name, backend in (
+        ("Playwright", html_to_image_playwright),
+        ("imgkit", html_to_image_imgkit),
+        ("Selenium", html_to_image_selenium),
+    ):
+        image_path, image_bytes = backend(html_content, retain_file=retain_file)
+        if image_bytes is not None:
+            logger.info("%s render succeeded via %s", label, backend_name)
+            return image_path, image_bytes
+
+    logger.warning("%s render failed in Playwright, imgkit and Selenium", label.capitalize())
+    return None, None
+
+
+def task_cache_key(task):
+    """Build a cache key from the fields that affect a task card, or None if uncacheable."""
+    if not hasattr(task, 'name'):
+        # Dict-style tasks default their date to "today", so they are never cached
+        return None
+    attachment_bytes = getattr(task, 'attachment_bytes', None)
+    attachment_digest = hashlib.blake2b(attachment_bytes, digest_size=16).digest() if attachment_bytes else b""
+    return (
+        task.name,
+        task.priority,
+        task.due_date,
+        getattr(task, 'operator_signature', None) or "",
+        attachment_digest,
+    )
+
+
+def _render_cache_get(key):
+    if key is None:
+        return None
+    with _render_cache_lock:
+        img_bytes = _render_cache.get(key)
+        if img_bytes is not None:
+            _render_cache.move_to_end(key)
+        return img_bytes
+
+
+def _render_cache_put(key, img_bytes):
+    if key is None or img_bytes is None:
+        return
+    with _render_cache_lock:
+        _render_cache[key] = img_bytes
+        _render_cache.move_to_end(key)
+        while len(_render_cache) > RENDER_CACHE_SIZE:
+            _render_cache.popitem(last=False)
+
+
+def _cached_result(img_bytes, retain_file):
+    return (_write_temp_png(img_bytes) if retain_file else None), img_bytes
+
+
 def create_task_image(task_data, retain_file=True):
     """Create task card image from HTML, optionally avoiding filesystem writes."""
+    cache_key = task_cache_key(task_data)
+    cached = _render_cache_get(cache_key)
+    if cached is not None:
+        logger.info("Task card served from render cache")
+        return _cached_result(cached, retain_file)
+
     html_content = create_task_html(task_data)
+    image_path, image_bytes = _render_html(html_content, retain_file, "task card")
+    _render_cache_put(cache_key, image_bytes)
+    return image_path, image_bytes
 
-    logger.info("Starting task card image render; retain_file=%s", retain_file)
-    image_path, image_bytes = html_to_image_imgkit(html_content, retain_file=retain_file)
 
-    if image_bytes is None:
-        logger.info("Falling back to Selenium for task card render")
-        image_path, image_bytes = html_to_image_selenium(html_content, retain_file=retain_file)
-    else:
-        logger.info("imgkit render succeeded; skipping Selenium fallback")
+# Returns [top, height] of every ticket relative to the batch wrapper
+_TICKET_OFFSETS_JS = """
+const batchTop = document.querySelector('.ticket-batch').getBoundingClientRect().top;
+return Array.from(document.querySelectorAll('.ticket-batch > .ticket-container')).map(el => {
+    const rect = el.getBoundingClientRect();
+    return [Math.round(rect.top - batchTop), Math.round(rect.height)];
+});
+"""
+
+
+def _stack_ticket_documents(documents):
+    """Merge full ticket HTML documents into one page with tickets stacked vertically."""
+    head, _, _ = documents[0].partition("<body>")
+    bodies = []
+    for document in documents:
+        _, _, rest = document.partition("<body>")
+        body, _, _ = rest.rpartition("</body>")
+        bodies.append(body)
+    return f"{head}<body><div class=\"ticket-batch\">{''.join(bodies)}</div></body></html>"
+
+
+def _slice_ticket_sheet(sheet_bytes, offsets, retain_file):
+    """Crop a stacked ticket screenshot into one PNG per ticket."""
+    results = []
+    with Image.open(BytesIO(sheet_bytes)) as sheet:
+        for top, height in offsets:
+            buf = BytesIO()
+            sheet.crop((0, top, sheet.width, top + height)).save(buf, format="PNG")
+            img_bytes = buf.getvalue()
+            results.append((_write_temp_png(img_bytes) if retain_file else None, img_bytes))
+    return results
+
+
+def _screenshot_ticket_sheet(driver, url):
+    _load_ticket_page(driver, url)
+    offsets = driver.execute_script(_TICKET_OFFSETS_JS)
+    return driver.find_element(By.CLASS_NAME, "ticket-batch").screenshot_as_png, offsets
+
+
+def _render_ticket_sheet(html_content):
+    """Screenshot a stacked ticket page once; return ``(png_bytes, offsets)`` or ``(None, None)``.
+
+    Only the browser backend ``_render_html`` would pick for a single ticket is
+    used, so batched and single tickets come from the same engine. When that
+    backend is wkhtmltoimage, which cannot report ticket offsets, nothing is
+    attempted and the caller renders tickets one by one.
+    """
+    if _playwright_renderer.is_usable():
+        try:
+            return _playwright_renderer.render_batch(html_content, ".ticket-batch", _TICKET_OFFSETS_JS)
+        except Exception:
+            logger.exception("Playwright batch render failed")
+            return None, None
+
+    if SELENIUM_AVAILABLE and not _imgkit_usable():
+        url = f"data:text/html;charset=utf-8,{quote(html_content)}"
+        try:
+            return _with_driver(_screenshot_ticket_sheet, url)
+        except Exception:
+            logger.exception("Selenium batch render failed")
 
-    if image_bytes is None:
-        logger.warning("Task card render failed in both imgkit and Selenium")
+    return None, None
 
-    return image_path, image_bytes
+
+def create_task_images(tasks, retain_file=True):
+    """Render several task cards with a single screenshot, sliced per ticket.
+
+    Returns a list of ``(image_path, image_bytes)`` in the order of ``tasks``.
+    wkhtmltoimage cannot report element positions, so when no browser backend
+    can render the batch each ticket is rendered on its own instead.
+    """
+    results = [None] * len(tasks)
+    misses = []
+    for index, task in enumerate(tasks):
+        cached = _render_cache_get(task_cache_key(task))
+        if cached is None:
+            misses.append(index)
+        else:
+            results[index] = _cached_result(cached, retain_file)
+
+    # Build each ticket's HTML on its own so one bad ticket cannot fail the batch
+    documents = []
+    renderable = []
+    for index in misses:
+        try:
+            documents.append(create_task_html(tasks[index]))
+        except Exception:
+            logger.exception("Could not build task card HTML; skipping this ticket")
+            results[index] = (None, None)
+        else:
+            renderable.append(index)
+    misses = renderable
+
+    if len(misses) > 1:
+        logger.info("Starting batched render of %d task cards", len(misses))
+        html_content = _stack_ticket_documents(documents)
+        sheet_bytes, offsets = _render_ticket_sheet(html_content)
+        if sheet_bytes is not None and offsets and len(offsets) == len(misses):
+            try:
+                sliced = _slice_ticket_sheet(sheet_bytes, offsets, retain_file)
+            except Exception:
+                logger.exception("Slicing batched ticket render failed")
+            else:
+                for index, result in zip(misses, sliced):
+                    results[index] = result
+                    _render_cache_put(task_cache_key(tasks[index]), result[1])
+                return results
+        logger.info("Batched render unavailable; rendering task cards individually")
+
+    for index in misses:
+        results[index] = create_task_image(tasks[index], retain_file=retain_file)
+    return results
 
 
 def create_task_html_image(task_data):
@@ -466,17 +721,4 @@ def create_todolist_html(title, items):
 def create_todolist_image(title, items, retain_file=True):
     """Create todolist image from HTML, optionally avoiding filesystem writes."""
     html_content = create_todolist_html(title, items)
-
-    logger.info("Starting todolist image render; retain_file=%s", retain_file)
-    image_path, image_bytes = html_to_image_imgkit(html_content, retain_file=retain_file)
-
-    if image_bytes is None:
-        logger.info("Falling back to Selenium for todolist render")
-        image_path, image_bytes = html_to_image_selenium(html_content, retain_file=retain_file)
-    else:
-        logger.info("imgkit render succeeded; skipping Selenium fallback")
-
-    if image_bytes is None:
-        logger.warning("Todolist render failed in both imgkit and Selenium")
-
-    return image_path, image_bytes
+    return _render_html(html_content, retain_file, "todolist")
@@ -3,6 +3,7 @@
 import io
 import os
 import socket
+import threading
 from typing import Optional, Union
 
 from PIL import Image
@@ -10,8 +11,12 @@ from escpos.printer import Usb, Serial, Network, File
 
 PrinterTransport = Union[Usb, Serial, Network, File]
 
+# One transport is kept open across prints; the printer handles a single job at a time
+_PRINTER: Optional[PrinterTransport] = None
+_LOCK = threading.Lock()
 
-def _get_printer() -> PrinterTransport:
+
+def _create_printer() -> PrinterTransport:
     """Configure printer transport."""
     # Option 1: USB Connection (most common)
     # printer = Usb(0x0483, 0x5720)  # CHANGE THESE VALUES!
@@ -30,9 +35,43 @@ def _get_printer() -> PrinterTransport:
     return printer
 
 
-def print_to_thermal_printer(image_bytes: Optional[bytes] = None) -> None:
+def _get_printer() -> PrinterTransport:
+    """Return the shared printer transport, creating it on first use.
+
+    Callers must hold ``_LOCK``. The connection itself opens lazily on first write.
+    """
+    global _PRINTER
+    if _PRINTER is None:
+        _PRINTER = _create_printer()
+    return _PRINTER
+
+
+def _reset_printer() -> None:
+    """Drop the shared transport so the next print reconnects. Callers must hold ``_LOCK``."""
+    global _PRINTER
+    if _PRINTER is not None:
+        try:
+            _PRINTER.close()
+        except Exception:
+            pass
+        _PRINTER = None
+
+
+def _send_job(printer: PrinterTransport, img_source: Image.Image, cut_feed: bool) -> None:
+    # Print the image (bitImageColumn works well for most printers).
+    # The web app hands over images it has already dithered to 1-bit; escpos
+    # still converts anything else itself.
+    printer.image(img_source, impl="bitImageColumn", center=True)
+
+    # Cut the paper
+    printer.cut(feed=cut_feed)
+
+
+def print_to_thermal_printer(image_bytes: Optional[Union[bytes, Image.Image]] = None) -> None:
     """Print image to thermal printer.
 
+    Accepts encoded image bytes or an already-decoded PIL image.
+
     Supports multiple connection methods across Windows and Linux.
     Edit the connection method below based on your printer setup.
     Cut mode and feed are configurable via env:
@@ -41,20 +80,28 @@ def print_to_thermal_printer(image_bytes: Optional[bytes] = None) -> None:
     if not image_bytes:
         raise ValueError("No image provided to print.")
 
-    printer = _get_printer()
-
     try:
         cut_feed = os.getenv("PRINTER_CUT_FEED", "true").lower() not in {"false", "0", "no"}
     except ValueError:
         cut_feed = False
 
-    img_source = Image.open(io.BytesIO(image_bytes))
-
-    # Print the image (bitImageColumn works well for most printers)
-    printer.image(img_source, impl="bitImageColumn", center=True)
-
-    # Cut the paper
-    printer.cut(feed=cut_feed)
+    if isinstance(image_bytes, Image.Image):
+        img_source = image_bytes
+    else:
+        img_source = Image.open(io.BytesIO(image_bytes))
+
+    with _LOCK:
+        try:
+            try:
+                _send_job(_get_printer(), img_source, cut_feed)
+            except OSError:
+                # The kept-alive socket may have been dropped by the printer; reconnect once
+                _reset_printer()
+                _send_job(_get_printer(), img_source, cut_feed)
+        except Exception:
+            # A failed connect leaves escpos without a device, so start fresh next time
+            _reset_printer()
+            raise
 
     print("Successfully printed to thermal printer!")
 
@@ -65,13 +65,23 @@ function showDialog({ success, title, bodyHtml }) {
 }
 
 /* History loading and rendering */
+let historyRetryTimer = null;
+
 function loadHistory() {
   const historyList = document.getElementById('history-list');
   if (!historyList) return;
 
+  clearTimeout(historyRetryTimer);
   fetch('/history')
     .then(res => res.json())
-    .then(data => renderHistory(data.items || []))
+    .then(data => {
+      const items = data.items || [];
+      renderHistory(items);
+      // Prints finish in the background; poll until every queued job has an outcome
+      if (items.some(item => item.printer_ok === null)) {
+        historyRetryTimer = setTimeout(loadHistory, 1500);
+      }
+    })
     .catch(err => console.warn('Failed to load history', err));
 }
 
@@ -95,6 +105,11 @@ function renderHistory(items) {
       titleText = escapeHtml(item.name || 'Untitled task');
       metaText = `Priority: ${priorityLabels[item.priority] || item.priority} \u00b7 Due: ${escapeHtml(item.due_date)}`;
     }
+    if (item.printer_ok === false) {
+      metaText += ` \u00b7 <span class="history-error">${escapeHtml(item.error || 'Print failed')}</span>`;
+    } else if (item.printer_ok === null) {
+      metaText += ' \u00b7 Printing\u2026';
+    }
     const editBtn = item.type === 'todolist'
       ? `<button class="btn-secondary" data-edit-todolist="${item.id}">Edit</button>`
       : '';
@@ -110,7 +110,7 @@ document.addEventListener('DOMContentLoaded', () => {
             ${result.preview ? `<div class="preview"><img src="${result.preview}" alt="Printed ticket preview" /></div>` : ''}
           `;
         }
-        showDialog({ success: true, title: 'Sent to printer', bodyHtml });
+        showDialog({ success: true, title: 'Queued for printing', bodyHtml });
         const savedDueDate = dueDateInput.value;
         form.reset();
         dueDateInput.value = savedDueDate;
@@ -1,151 +1,457 @@
 #!/usr/bin/env python3
 """Minimal web UI to submit a task and print to the receipt printer."""
 
-import base64
+import asyncio
+import binascii
+import functools
+import gzip
+import hashlib
+import itertools
+import logging
+import mimetypes
 import os
-from collections import deque
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
 from pathlib import Path
 from types import SimpleNamespace
 from typing import Optional
 
-from fastapi import FastAPI, Request, UploadFile, File, Form
-from fastapi.responses import FileResponse, HTMLResponse, JSONResponse
+import orjson
+from fastapi import BackgroundTasks, FastAPI, Request
+from fastapi.responses import HTMLResponse, JSONResponse, Response
 from fastapi.staticfiles import StaticFiles
+from starlette.datastructures import Headers, UploadFile
 from dotenv import load_dotenv
 from io import BytesIO
 from PIL import Image
 
-from .html_generator import create_task_image, create_todolist_image
+from .html_generator import create_task_image, create_task_images, create_todolist_image, task_cache_key
 from . import print_to_thermal_printer
 from .printer import check_printer_reachable
 
-load_dotenv()
-RETAIN_TICKET_FILES = os.getenv("RETAIN_TICKET_FILES", "false").lower() not in {"false", "0", "no"}
-WEB_APP_HOST = os.getenv("WEB_APP_HOST", "127.0.0.1")
-WEB_APP_PORT = int(os.getenv("WEB_APP_PORT", "8000"))
-PRINTER_IMAGE_WIDTH = int(os.getenv("PRINTER_IMAGE_WIDTH", "576"))
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class Settings:
+    """Web app configuration read from the environment (and ``.env``)."""
+
+    retain_ticket_files: bool
+    host: str
+    port: int
+    printer_image_width: int
+    max_attachment_bytes: int
+    # Task cards submitted within this window are rendered together in one screenshot
+    render_batch_window: float
+    # Caps simultaneous browser/wkhtmltoimage renders so bursts queue instead of thrashing
+    render_concurrency: int
+
+
+@functools.lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Load settings once; call ``get_settings.cache_clear()`` to pick up env changes."""
+    load_dotenv()
+    return Settings(
+        retain_ticket_files=os.getenv("RETAIN_TICKET_FILES", "false").lower() not in {"false", "0", "no"},
+        host=os.getenv("WEB_APP_HOST", "127.0.0.1"),
+        port=int(os.getenv("WEB_APP_PORT", "8000")),
+        printer_image_width=int(os.getenv("PRINTER_IMAGE_WIDTH", "576")),
+        max_attachment_bytes=int(os.getenv("MAX_ATTACHMENT_BYTES", str(8 * 1024 * 1024))),
+        render_batch_window=float(os.getenv("RENDER_BATCH_WINDOW_MS", "50")) / 1000,
+        render_concurrency=int(os.getenv("RENDER_CONCURRENCY", "2")),
+    )
+
+
+# Submitted priority values; anything else falls back to medium (2)
+_PRIO_MAP = {"1": 1, "2": 2, "3": 3}
 HISTORY_LIMIT = 10
-_history = deque(maxlen=HISTORY_LIMIT)
+# JSON-ready /history items, newest first. Each is built once when the print is
+# recorded and never mutated, so /history can hand out the same dicts every poll.
+_history_view = deque(maxlen=HISTORY_LIMIT)
+# Monotonic history ids; next() is atomic, so concurrent prints never share one
+_next_id = itertools.count(1)
+# Printed PNG bytes by history id; kept apart so /history never touches them
+_image_store = {}
+# Error from the most recent background /print job, or None once one succeeds
+_last_print_error = None
+
+# Processed tickets (1-bit PNG bytes, preview) under the same key as the
+# html_generator render cache. That cache holds the raw screenshot for every
+# caller; this one also skips the dither/encode pass and the render queue for
+# repeat /print posts. Only touched from the event loop, so no lock is needed.
+TICKET_CACHE_SIZE = 32
+_ticket_cache = OrderedDict()
+
+RENDER_BATCH_MAX = 8
+_pending_renders = []
+_render_flush_scheduled = False
+_render_flush_tasks = set()
+
+# Pillow conversions and printer I/O run here so they never block the event loop
+_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="print-io")
+
+_render_sem = None
 
 STATIC_DIR = Path(__file__).parent / "static"
-
-app = FastAPI()
-app.mount("/static", StaticFiles(directory=str(STATIC_DIR)), name="static")
+STATIC_CACHE_CONTROL = "public, max-age=300"
+# Preview URLs carry a content digest, so browsers may keep them indefinitely
+PREVIEW_CACHE_CONTROL = "public, max-age=86400, immutable"
+_COMPRESSIBLE_SUFFIXES = {".html", ".css", ".js"}
+
+
+class PrecompressedStaticFiles(StaticFiles):
+    """StaticFiles that serves text assets from memory, gzip-compressed when accepted.
+
+    Responses for preloaded assets are built once at startup and shared across
+    requests; nothing downstream mutates them.
+    """
+
+    def __init__(self, *, directory: Path, **kwargs):
+        super().__init__(directory=str(directory), **kwargs)
+        self._assets = {}
+        for path in Path(directory).rglob("*"):
+            if path.is_file() and path.suffix in _COMPRESSIBLE_SUFFIXES:
+                self._assets[path.relative_to(directory).as_posix()] = self._build_responses(path)
+
+    @staticmethod
+    def _build_responses(path: Path):
+        """Return ``{use_gzip: (etag, response, not_modified_response)}`` for ``path``."""
+        data = path.read_bytes()
+        digest = hashlib.md5(data).hexdigest()
+        media_type = mimetypes.guess_type(path.name)[0] or "application/octet-stream"
+        responses = {}
+        for use_gzip, body in ((False, data), (True, gzip.compress(data, compresslevel=9))):
+            etag = f'"{digest}-gz"' if use_gzip else f'"{digest}"'
+            headers = {
+                "Cache-Control": STATIC_CACHE_CONTROL,
+                "ETag": etag,
+                "Vary": "Accept-Encoding",
+            }
+            not_modified = Response(status_code=304, headers=headers)
+            if use_gzip:
+                headers = {**headers, "Content-Encoding": "gzip"}
+            responses[use_gzip] = (etag, Response(body, media_type=media_type, headers=headers), not_modified)
+        return responses
+
+    def asset_response(self, name: str, request_headers: Headers) -> Optional[Response]:
+        """Return the cached response for a preloaded asset, or None if it is not preloaded."""
+        asset = self._assets.get(name)
+        if asset is None:
+            return None
+        etag, response, not_modified = asset["gzip" in request_headers.get("accept-encoding", "")]
+        if request_headers.get("if-none-match") == etag:
+            return not_modified
+        return response
+
+    async def get_response(self, path: str, scope) -> Response:
+        if scope["method"] in ("GET", "HEAD"):
+            response = self.asset_response(Path(path).as_posix(), Headers(scope=scope))
+            if response is not None:
+                return response
+
+        response = await super().get_response(path, scope)
+        response.headers.setdefault("Cache-Control", STATIC_CACHE_CONTROL)
+        return response
+
+
+class ORJSONResponse(JSONResponse):
+    """JSONResponse that serializes with orjson, straight to bytes.
+
+    FastAPI's own ORJSONResponse is deprecated, hence this local copy.
+    """
+
+    def render(self, content):
+        return orjson.dumps(content)
+
+
+app = FastAPI(default_response_class=ORJSONResponse)
+_static_files = PrecompressedStaticFiles(directory=STATIC_DIR)
+app.mount("/static", _static_files, name="static")
 
 
 @app.get("/", response_class=HTMLResponse)
-def index():
-    return FileResponse(STATIC_DIR / "task.html", media_type="text/html")
+def index(request: Request):
+    return _static_files.asset_response("task.html", request.headers)
 
 
 @app.get("/todolist", response_class=HTMLResponse)
-def todolist_page():
-    return FileResponse(STATIC_DIR / "todolist.html", media_type="text/html")
-
-
-def normalize_image_for_printer(image_bytes: bytes, target_width: int) -> bytes:
-    """Scale and pad image bytes to the printer width to avoid cropping."""
-    with Image.open(BytesIO(image_bytes)) as im:
-        im = im.convert("L")
-        width, height = im.size
-        if width <= 0 or height <= 0:
-            raise ValueError("Invalid image dimensions.")
-        if width != target_width:
-            scale = target_width / float(width)
-            new_height = max(1, int(height * scale))
-            im = im.resize((target_width, new_height), Image.LANCZOS)
-        if im.size[0] != target_width:
-            canvas = Image.new("L", (target_width, im.size[1]), 255)
-            canvas.paste(im, (0, 0))
-            im = canvas
-        buf = BytesIO()
-        im.save(buf, format="PNG")
-        return buf.getvalue()
-
-
-def _to_grayscale_preview(image_bytes):
-    """Convert image bytes to grayscale and return (image_bytes, preview_data_uri)."""
-    preview_data = None
-    if image_bytes is not None:
-        try:
-            with Image.open(BytesIO(image_bytes)) as im:
-                gray = im.convert("L")
-                buf = BytesIO()
-                gray.save(buf, format="PNG")
-                image_bytes = buf.getvalue()
-                encoded = base64.b64encode(image_bytes).decode("ascii")
-                preview_data = f"data:image/png;base64,{encoded}"
-        except Exception:
+def todolist_page(request: Request):
+    return _static_files.asset_response("todolist.html", request.headers)
+
+
+def _fit_to_width(im: Image.Image, target_width: int) -> Image.Image:
+    """Scale a grayscale image to the printer width to avoid cropping."""
+    width, height = im.size
+    if width <= 0 or height <= 0:
+        raise ValueError("Invalid image dimensions.")
+    if width != target_width:
+        im = im.resize((target_width, max(1, height * target_width // width)), Image.LANCZOS)
+    return im
+
+
+async def _read_capped(upload: UploadFile, limit: int) -> Optional[bytes]:
+    """Read an upload in chunks, returning None once it grows past ``limit`` bytes."""
+    buf = bytearray()
+    while chunk := await upload.read(64 * 1024):
+        buf.extend(chunk)
+        if len(buf) > limit:
+            return None
+    return bytes(buf)
+
+
+async def _run_blocking(func, *args, **kwargs):
+    """Run a blocking call on the shared executor and await its result."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_EXECUTOR, functools.partial(func, *args, **kwargs))
+
+
+_PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+
+def _is_bilevel_png(data, width=None):
+    """Check the IHDR header for a 1-bit grayscale PNG, optionally of ``width`` pixels."""
+    # IHDR follows the signature: length, type, width, height, bit depth, colour type
+    if len(data) < 26 or data[:8] != _PNG_SIGNATURE or data[12:16] != b"IHDR":
+        return False
+    if data[24] != 1 or data[25] != 0:
+        return False
+    return width is None or int.from_bytes(data[16:20], "big") == width
+
+
+def _to_grayscale_png(image_bytes, target_width=None):
+    """Decode image bytes once into the bilevel image the thermal printer produces.
+
+    Returns (print_source, image_bytes, preview_data_uri). ``print_source`` is the
+    Floyd-Steinberg dithered 1-bit PIL image handed straight to the printer and
+    ``image_bytes`` its 1-bit PNG encoding, kept for reprints; the preview is that
+    same PNG as a data URI, used both in the print response and in history. When
+    ``target_width`` is given the image is scaled to it. Input that is already a
+    1-bit PNG of the right width is used as-is; undecodable input is passed
+    through unchanged, without a preview.
+
+    Dithering here rather than leaving it to escpos lets the stored reprint
+    bytes and the preview match exactly what comes out of the printer, and a
+    1-bit PNG is several times smaller than a grayscale one.
+    """
+    if image_bytes is None:
+        return None, None, None
+    if _is_bilevel_png(image_bytes, target_width):
+        return image_bytes, image_bytes, _data_uri(image_bytes)
+    try:
+        with Image.open(BytesIO(image_bytes)) as im:
+            if target_width and im.width > target_width:
+                # JPEGs decode straight to a downscaled grayscale raster
+                im.draft("L", (target_width, max(1, im.height * target_width // im.width)))
+            gray = im.convert("L")
+        if target_width:
             try:
-                encoded = base64.b64encode(image_bytes).decode("ascii")
-                preview_data = f"data:image/png;base64,{encoded}"
-            except Exception:
-                preview_data = None
-    return image_bytes, preview_data
+                gray = _fit_to_width(gray, target_width)
+            except ValueError:
+                pass
+        bw = gray.convert("1", dither=Image.FLOYDSTEINBERG)
+        buf = BytesIO()
+        # 1-bit PNGs are several times smaller than 8-bit grayscale ones
+        bw.save(buf, format="PNG", optimize=True)
+        png_bytes = buf.getvalue()
+        return bw, png_bytes, _data_uri(png_bytes)
+    except Exception:
+        return image_bytes, image_bytes, None
+
+
+def _data_uri(image_bytes, mime_type="image/png"):
+    """Encode image bytes as a data URI for inline previews."""
+    if not image_bytes:
+        return None
+    encoded = binascii.b2a_base64(image_bytes, newline=False).decode("ascii")
+    return f"data:{mime_type};base64,{encoded}"
+
+
+def _ticket_cache_get(key):
+    cached = _ticket_cache.get(key)
+    if cached is not None:
+        _ticket_cache.move_to_end(key)
+    return cached
+
+
+def _ticket_cache_put(key, value):
+    _ticket_cache[key] = value
+    _ticket_cache.move_to_end(key)
+    while len(_ticket_cache) > TICKET_CACHE_SIZE:
+        _ticket_cache.popitem(last=False)
+
+
+def _preview_url(item_id, image_bytes):
+    """Return the /preview URL for a stored print, versioned by its content.
+
+    Ids restart with the process, so the digest keeps browsers from showing a
+    previous run's cached preview for a reused id.
+    """
+    digest = hashlib.blake2b(image_bytes, digest_size=8).hexdigest()
+    return f"/preview/{item_id}?v={digest}"
+
+
+def _remember_print(item, image_bytes):
+    """Add a /history item, keeping its bytes in ``_image_store`` for reprints."""
+    if len(_history_view) == _history_view.maxlen:
+        _image_store.pop(_history_view[-1]["id"], None)
+    _history_view.appendleft(item)
+    _image_store[item["id"]] = image_bytes
+
+
+def _render_tasks(tasks, retain_file):
+    """Render task cards in a worker thread; returns [(image_path, image_bytes), ...]."""
+    if len(tasks) == 1:
+        return [create_task_image(tasks[0], retain_file=retain_file)]
+    return create_task_images(tasks, retain_file=retain_file)
+
+
+def _render_semaphore():
+    """Return the semaphore capping concurrent renders, created on first use."""
+    global _render_sem
+    if _render_sem is None:
+        _render_sem = asyncio.Semaphore(get_settings().render_concurrency)
+    return _render_sem
+
+
+def _schedule_render_flush(loop):
+    task = loop.create_task(_flush_pending_renders())
+    _render_flush_tasks.add(task)
+    task.add_done_callback(_render_flush_tasks.discard)
+
+
+async def _flush_pending_renders():
+    """Render one batch of queued task cards and resolve their waiting futures."""
+    global _render_flush_scheduled
+    try:
+        await asyncio.sleep(get_settings().render_batch_window)
+    except asyncio.CancelledError:
+        _render_flush_scheduled = False
+        raise
+
+    batch = _pending_renders[:RENDER_BATCH_MAX]
+    del _pending_renders[:RENDER_BATCH_MAX]
+    # Hand leftovers (or later arrivals) to a new flush so batches can render concurrently
+    if _pending_renders:
+        _schedule_render_flush(asyncio.get_running_loop())
+    else:
+        _render_flush_scheduled = False
+
+    try:
+        async with _render_semaphore():
+            results = await asyncio.to_thread(
+                _render_tasks, [task for task, _ in batch], get_settings().retain_ticket_files
+            )
+    except Exception as exc:
+        for _, future in batch:
+            if not future.done():
+                future.set_exception(exc)
+    else:
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+
+
+async def _render_task_batched(task_obj):
+    """Queue a task card render and wait for its (image_path, image_bytes)."""
+    global _render_flush_scheduled
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+    _pending_renders.append((task_obj, future))
+    if not _render_flush_scheduled:
+        _render_flush_scheduled = True
+        _schedule_render_flush(loop)
+    return await future
+
+
+def _record_print_result(item_id, error):
+    """Swap in a copy of the history item carrying the outcome of its print job."""
+    global _last_print_error
+    _last_print_error = error
+    for index, item in enumerate(_history_view):
+        if item["id"] == item_id:
+            _history_view[index] = {**item, "printer_ok": error is None, "error": error}
+            break
+
+
+async def _print_in_background(item_id, print_source):
+    try:
+        await _run_blocking(print_to_thermal_printer, image_bytes=print_source)
+    except Exception as e:
+        _record_print_result(item_id, f"Failed to print: {e}")
+    else:
+        _record_print_result(item_id, None)
+
+
+def _form_text(form, key):
+    """Return a stripped text field, treating a missing or file-valued field as empty."""
+    value = form.get(key)
+    return value.strip() if isinstance(value, str) else ""
 
 
-def _next_history_id():
-    return (_history[0]["id"] + 1) if _history else 1
+def _is_valid_due_date(due_date):
+    """Check the due date parses the way the ticket renderer will parse it."""
+    try:
+        datetime.fromisoformat(due_date.replace("Z", "+00:00"))
+    except ValueError:
+        return False
+    return True
 
 
 @app.post("/print")
-async def handle_print(
-    request: Request,
-    name: Optional[str] = Form(default=None),
-    priority: Optional[str] = Form(default=None),
-    due_date: Optional[str] = Form(default=None),
-    operator_signature: Optional[str] = Form(default=None),
-    image_only: Optional[str] = Form(default=None),
-    attachment: Optional[UploadFile] = File(default=None),
-):
+async def handle_print(request: Request, background_tasks: BackgroundTasks):
+    # Parse the body by hand so JSON posts never go through the form parser
     content_type = request.headers.get("content-type", "")
+    attachment_bytes = None
     if "application/json" in content_type:
         payload = await request.json()
         name = (payload.get("name") or "").strip()
-        priority_raw = str(payload.get("priority") or "2").strip()
+        priority = _PRIO_MAP.get(str(payload.get("priority")).strip(), 2)
         due_date = (payload.get("due_date") or "").strip()
         operator_signature = (payload.get("operator_signature") or "").strip()
         image_only_flag = bool(payload.get("image_only"))
-        attachment_bytes = None
     else:
-        name = (name or "").strip()
-        priority_raw = (priority or "2").strip()
-        due_date = (due_date or "").strip()
-        operator_signature = (operator_signature or "").strip()
-        image_only_flag = bool(image_only)
-        attachment_bytes = None
-        if attachment:
-            try:
-                attachment_bytes = await attachment.read()
-            except Exception:
-                attachment_bytes = None
+        async with request.form() as form:
+            name = _form_text(form, "name")
+            priority = _PRIO_MAP.get(_form_text(form, "priority"), 2)
+            due_date = _form_text(form, "due_date")
+            operator_signature = _form_text(form, "operator_signature")
+            image_only_flag = bool(_form_text(form, "image_only"))
+            attachment = form.get("attachment")
+            if isinstance(attachment, UploadFile):
+                try:
+                    attachment_bytes = await _read_capped(attachment, get_settings().max_attachment_bytes)
+                except Exception:
+                    attachment_bytes = b""
+                if attachment_bytes is None:
+                    return ORJSONResponse(
+                        {"success": False, "error": "Attachment too large."},
+                        status_code=413,
+                    )
 
     if image_only_flag and not attachment_bytes:
-        return JSONResponse(
+        return ORJSONResponse(
             {"success": False, "error": "Image-only mode requires an attachment."},
             status_code=400,
         )
 
     if not image_only_flag and (not name or not due_date):
-        return JSONResponse(
+        return ORJSONResponse(
             {"success": False, "error": "Missing name or due date."},
             status_code=400,
         )
 
-    try:
-        priority = int(priority_raw)
-        if priority not in (1, 2, 3):
-            priority = 2
-    except Exception:
-        priority = 2
+    if not image_only_flag and not _is_valid_due_date(due_date):
+        return ORJSONResponse(
+            {"success": False, "error": "Invalid due date; use YYYY-MM-DD."},
+            status_code=400,
+        )
 
     if image_only_flag:
-        image_bytes = attachment_bytes
-        if image_bytes:
-            try:
-                image_bytes = normalize_image_for_printer(image_bytes, PRINTER_IMAGE_WIDTH)
-            except Exception:
-                pass
+        print_source, image_bytes, preview_data = await _run_blocking(
+            _to_grayscale_png, attachment_bytes, get_settings().printer_image_width
+        )
     else:
         task_obj = SimpleNamespace(
             name=name,
@@ -154,43 +460,47 @@ async def handle_print(
             operator_signature=operator_signature,
             attachment_bytes=attachment_bytes,
         )
-
-        _, image_bytes = create_task_image(task_obj, retain_file=RETAIN_TICKET_FILES)
-        if image_bytes is None:
-            return JSONResponse(
-                {
-                    "success": False,
-                    "error": "Failed to render ticket image. Ensure wkhtmltoimage or Selenium+Chrome are installed.",
-                },
-                status_code=500,
+        cache_key = task_cache_key(task_obj)
+        cached = _ticket_cache_get(cache_key)
+        if cached is not None:
+            image_bytes, preview_data = cached
+            print_source = image_bytes
+        else:
+            try:
+                _, image_bytes = await _render_task_batched(task_obj)
+            except Exception:
+                logger.exception("Rendering ticket failed")
+                image_bytes = None
+            if image_bytes is None:
+                return ORJSONResponse(
+                    {
+                        "success": False,
+                        "error": "Failed to render ticket image. Ensure wkhtmltoimage or Selenium+Chrome are installed.",
+                    },
+                    status_code=500,
+                )
+
+            print_source, image_bytes, preview_data = await _run_blocking(
+                _to_grayscale_png, image_bytes
             )
+            _ticket_cache_put(cache_key, (image_bytes, preview_data))
+
+    item_id = next(_next_id)
+    _remember_print({
+        "id": item_id,
+        "type": "task",
+        "name": name or "Image-only print",
+        "priority": priority,
+        "due_date": due_date,
+        "preview": _preview_url(item_id, image_bytes) if preview_data else None,
+        "image_only": image_only_flag,
+        # None while the job is queued; set by _print_in_background
+        "printer_ok": None,
+    }, image_bytes)
+    # Respond with the preview now; printer errors surface on the next /history poll
+    background_tasks.add_task(_print_in_background, item_id, print_source)
 
-    image_bytes, preview_data = _to_grayscale_preview(image_bytes)
-
-    try:
-        print_to_thermal_printer(image_bytes=image_bytes)
-    except Exception as e:
-        return JSONResponse(
-            {"success": False, "error": f"Failed to print: {str(e)}"},
-            status_code=500,
-        )
-
-    try:
-        _history.appendleft({
-            "id": _next_history_id(),
-            "type": "task",
-            "name": name or "Image-only print",
-            "priority": priority,
-            "due_date": due_date,
-            "preview": preview_data,
-            "image_bytes": image_bytes,
-            "operator_signature": operator_signature,
-            "image_only": image_only_flag,
-        })
-    except Exception:
-        pass
-
-    return JSONResponse({
+    return ORJSONResponse({
         "success": True,
         "image_only": image_only_flag,
         "task": {
@@ -210,14 +520,17 @@ async def handle_print_todolist(request: Request):
     items = [s.strip() for s in (payload.get("items") or []) if s and s.strip()]
 
     if not items:
-        return JSONResponse(
+        return ORJSONResponse(
             {"success": False, "error": "At least one item is required."},
             status_code=400,
         )
 
-    _, image_bytes = create_todolist_image(title, items, retain_file=RETAIN_TICKET_FILES)
+    async with _render_semaphore():
+        _, image_bytes = await asyncio.to_thread(
+            create_todolist_image, title, items, retain_file=get_settings().retain_ticket_files
+        )
     if image_bytes is None:
-        return JSONResponse(
+        return ORJSONResponse(
             {
                 "success": False,
                 "error": "Failed to render todolist image. Ensure wkhtmltoimage or Selenium+Chrome are installed.",
@@ -225,30 +538,30 @@ async def handle_print_todolist(request: Request):
             status_code=500,
         )
 
-    image_bytes, preview_data = _to_grayscale_preview(image_bytes)
+    print_source, image_bytes, preview_data = await _run_blocking(
+        _to_grayscale_png, image_bytes
+    )
 
     try:
-        print_to_thermal_printer(image_bytes=image_bytes)
+        await _run_blocking(print_to_thermal_printer, image_bytes=print_source)
     except Exception as e:
-        return JSONResponse(
+        return ORJSONResponse(
             {"success": False, "error": f"Failed to print: {str(e)}"},
             status_code=500,
         )
 
-    try:
-        _history.appendleft({
-            "id": _next_history_id(),
-            "type": "todolist",
-            "name": title or "Todolist",
-            "items": items,
-            "item_count": len(items),
-            "preview": preview_data,
-            "image_bytes": image_bytes,
-        })
-    except Exception:
-        pass
+    item_id = next(_next_id)
+    _remember_print({
+        "id": item_id,
+        "type": "todolist",
+        "name": title or "Todolist",
+        "preview": _preview_url(item_id, image_bytes) if preview_data else None,
+        "item_count": len(items),
+        # A tuple, so the shared item list cannot change under later polls
+        "items": tuple(items),
+    }, image_bytes)
 
-    return JSONResponse({
+    return ORJSONResponse({
         "success": True,
         "item_count": len(items),
         "preview": preview_data,
@@ -258,53 +571,48 @@ async def handle_print_todolist(request: Request):
 @app.get("/history")
 async def history(_: Request):
     """Return recent prints (excluding raw bytes)."""
-    items = []
-    for entry in _history:
-        item = {
-            "id": entry["id"],
-            "type": entry.get("type", "task"),
-            "name": entry.get("name", ""),
-            "preview": entry.get("preview"),
-        }
-        if item["type"] == "todolist":
-            item["item_count"] = entry.get("item_count", 0)
-            item["items"] = entry.get("items", [])
-        else:
-            item["priority"] = entry.get("priority", 2)
-            item["due_date"] = entry.get("due_date", "")
-            item["image_only"] = entry.get("image_only", False)
-        items.append(item)
-    return JSONResponse({"items": items})
+    return ORJSONResponse({"items": list(_history_view), "last_error": _last_print_error})
+
+
+@app.get("/preview/{item_id}")
+async def preview(item_id: int):
+    """Serve a stored print's 1-bit PNG for history thumbnails."""
+    image_bytes = _image_store.get(item_id)
+    if image_bytes is None:
+        return ORJSONResponse({"success": False, "error": "Not found"}, status_code=404)
+    return Response(image_bytes, media_type="image/png", headers={"Cache-Control": PREVIEW_CACHE_CONTROL})
 
 
 @app.get("/health")
 def health():
-    return JSONResponse(check_printer_reachable())
+    return ORJSONResponse(check_printer_reachable())
 
 
 @app.post("/reprint")
 async def reprint(request: Request):
     """Reprint a previous ticket by id."""
     payload = await request.json()
-    target_id = str(payload.get("id"))
-
-    entry = next((h for h in _history if str(h["id"]) == target_id), None)
-    if not entry:
-        return JSONResponse({"success": False, "error": "Not found"}, status_code=404)
+    try:
+        image_bytes = _image_store.get(int(payload.get("id")))
+    except (TypeError, ValueError):
+        image_bytes = None
+    if image_bytes is None:
+        return ORJSONResponse({"success": False, "error": "Not found"}, status_code=404)
 
     try:
-        print_to_thermal_printer(image_bytes=entry.get("image_bytes"))
+        await _run_blocking(print_to_thermal_printer, image_bytes=image_bytes)
     except Exception as e:
-        return JSONResponse({"success": False, "error": f"Failed to reprint: {e}"}, status_code=500)
+        return ORJSONResponse({"success": False, "error": f"Failed to reprint: {e}"}, status_code=500)
 
-    return JSONResponse({"success": True})
+    return ORJSONResponse({"success": True})
 
 
 def main():
     """Run the development server via a script entry point."""
     import uvicorn
 
-    uvicorn.run(app, host=WEB_APP_HOST, port=WEB_APP_PORT)
+    settings = get_settings()
+    uvicorn.run(app, host=settings.host, port=settings.port)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,124 @@
+import threading
+from types import SimpleNamespace
+
+from task_card_generator import html_generator
+
+
+def test_batch_skipped_when_single_tickets_use_wkhtmltoimage(monkeypatch):
+    def no_driver():
+        raise AssertionError("webdriver should not be launched")
+
+    monkeypatch.setattr(html_generator._playwright_renderer, "is_usable", lambda: False)
+    monkeypatch.setattr(html_generator, "SELENIUM_AVAILABLE", True)
+    monkeypatch.setattr(html_generator, "_imgkit_usable", lambda: True)
+    monkeypatch.setattr(html_generator, "_get_driver", no_driver)
+
+    assert html_generator._render_ticket_sheet("<html><body></body></html>") == (None, None)
+
+
+def test_selenium_batch_retries_on_dead_driver(monkeypatch):
+    class DeadDriver:
+        def get(self, url):
+            raise html_generator.WebDriverException("chrome not reachable")
+
+    drivers = [DeadDriver(), SimpleNamespace(name="fresh")]
+    monkeypatch.setattr(html_generator._playwright_renderer, "is_usable", lambda: False)
+    monkeypatch.setattr(html_generator, "SELENIUM_AVAILABLE", True)
+    monkeypatch.setattr(html_generator, "_imgkit_usable", lambda: False)
+    monkeypatch.setattr(html_generator, "_get_driver", lambda: drivers[0])
+    monkeypatch.setattr(html_generator, "_reset_driver", lambda: drivers.pop(0))
+    monkeypatch.setattr(
+        html_generator, "_screenshot_ticket_sheet",
+        lambda driver, url: driver.get(url) if isinstance(driver, DeadDriver) else (b"sheet", [[0, 10]]),
+    )
+
+    assert html_generator._render_ticket_sheet("<html><body></body></html>") == (b"sheet", [[0, 10]])
+
+
+def _stub_probe(monkeypatch, tmp_path, from_string):
+    monkeypatch.setattr(html_generator, "_PROBE_CACHE_PATH", tmp_path / "probe" / "renderer_probe.json")
+    monkeypatch.setattr(html_generator, "_wkhtml_fingerprint", lambda: "wkhtmltoimage:1")
+    monkeypatch.setattr(html_generator, "imgkit", SimpleNamespace(from_string=from_string), raising=False)
+
+
+def test_probe_result_is_cached_and_reused(monkeypatch, tmp_path):
+    calls = []
+
+    def from_string(*args, **kwargs):
+        calls.append(1)
+        return b"png"
+
+    _stub_probe(monkeypatch, tmp_path, from_string)
+    assert html_generator._probe_imgkit() is True
+    assert html_generator._read_probe_cache() == {"wkhtmltoimage": "wkhtmltoimage:1", "imgkit_works": True}
+
+    assert html_generator._probe_imgkit() is True
+    assert calls == [1]
+
+
+def test_timed_out_probe_is_not_cached(monkeypatch, tmp_path):
+    release = threading.Event()
+    _stub_probe(monkeypatch, tmp_path, lambda *args, **kwargs: release.wait(5) and b"png")
+    monkeypatch.setattr(html_generator, "_PROBE_TIMEOUT", 0.05)
+    try:
+        assert html_generator._probe_imgkit() is False
+    finally:
+        release.set()
+    assert not html_generator._PROBE_CACHE_PATH.exists()
+
+
+def test_probe_cache_ignores_symlinks(monkeypatch, tmp_path):
+    _stub_probe(monkeypatch, tmp_path, lambda *args, **kwargs: b"png")
+    planted = tmp_path / "planted.json"
+    planted.write_text('{"wkhtmltoimage": "wkhtmltoimage:1", "imgkit_works": false}')
+    html_generator._PROBE_CACHE_PATH.parent.mkdir()
+    html_generator._PROBE_CACHE_PATH.symlink_to(planted)
+
+    assert html_generator._probe_imgkit() is True
+    assert not html_generator._PROBE_CACHE_PATH.is_symlink()
+
+
+def test_playwright_disabled_after_failed_launch(monkeypatch):
+    renderer = html_generator._playwright_renderer
+    launches = []
+
+    def launch(**kwargs):
+        launches.append(kwargs)
+        raise RuntimeError("Executable doesn't exist")
+
+    driver = SimpleNamespace(chromium=SimpleNamespace(launch=launch))
+    monkeypatch.setattr(renderer, "PLAYWRIGHT_AVAILABLE", True)
+    monkeypatch.setattr(renderer, "sync_playwright", lambda: SimpleNamespace(start=lambda: driver), raising=False)
+    monkeypatch.setattr(renderer, "_playwright", None)
+    monkeypatch.setattr(renderer, "_browser", None)
+    monkeypatch.setattr(renderer, "_launch_failed", False)
+    monkeypatch.setattr(renderer.shutil, "which", lambda name: None)
+
+    assert html_generator.html_to_image_playwright("<html></html>") == (None, None)
+    assert html_generator.html_to_image_playwright("<html></html>") == (None, None)
+    assert not renderer.is_usable()
+    assert len(launches) == 1
+
+
+def test_render_cache_reuses_identical_tasks(monkeypatch):
+    renders = []
+
+    def fake_render_html(html_content, retain_file, label):
+        renders.append(html_content)
+        return None, f"png{len(renders)}".encode()
+
+    monkeypatch.setattr(html_generator, "_render_html", fake_render_html)
+    monkeypatch.setattr(html_generator, "_shrink_attachment", lambda data: ("jpeg", data))
+    monkeypatch.setattr(html_generator, "_render_cache", type(html_generator._render_cache)())
+
+    def task(attachment):
+        return SimpleNamespace(name="Cache me", priority=1, due_date="2031-02-03",
+                               operator_signature="", attachment_bytes=attachment)
+
+    first = html_generator.create_task_image(task(b"photo-a"), retain_file=False)
+    again = html_generator.create_task_image(task(b"photo-a"), retain_file=False)
+    other = html_generator.create_task_image(task(b"photo-b"), retain_file=False)
+
+    assert first == again == (None, b"png1")
+    assert other == (None, b"png2")
+    assert len(renders) == 2
@@ -0,0 +1,48 @@
+import pytest
+from PIL import Image
+
+from task_card_generator import printer
+
+
+class FakeTransport:
+    def __init__(self, fail_first_image=False):
+        self.fail_first_image = fail_first_image
+        self.images = []
+        self.closed = False
+
+    def image(self, img, **kwargs):
+        if self.fail_first_image:
+            self.fail_first_image = False
+            raise BrokenPipeError("printer dropped the connection")
+        self.images.append(img)
+
+    def cut(self, feed=True):
+        pass
+
+    def close(self):
+        self.closed = True
+
+
+def test_print_reconnects_once_after_dropped_connection(monkeypatch):
+    stale = FakeTransport(fail_first_image=True)
+    fresh = FakeTransport()
+    transports = [stale, fresh]
+    monkeypatch.setattr(printer, "_PRINTER", None)
+    monkeypatch.setattr(printer, "_create_printer", lambda: transports.pop(0))
+
+    printer.print_to_thermal_printer(Image.new("1", (8, 8)))
+
+    assert stale.closed
+    assert len(fresh.images) == 1
+    assert printer._PRINTER is fresh
+
+
+def test_print_resets_transport_when_retry_fails(monkeypatch):
+    transports = [FakeTransport(fail_first_image=True), FakeTransport(fail_first_image=True)]
+    monkeypatch.setattr(printer, "_PRINTER", None)
+    monkeypatch.setattr(printer, "_create_printer", lambda: transports.pop(0))
+
+    with pytest.raises(OSError):
+        printer.print_to_thermal_printer(Image.new("1", (8, 8)))
+
+    assert printer._PRINTER is None
@@ -1,6 +1,11 @@
+import asyncio
+from io import BytesIO
+from types import SimpleNamespace
+
 from fastapi.testclient import TestClient
+from PIL import Image
 
-from task_card_generator import web_app
+from task_card_generator import html_generator, web_app
 
 
 def test_index_returns_html():
@@ -55,3 +60,256 @@ def test_image_only_requires_attachment(monkeypatch):
     assert resp.status_code == 400
     data = resp.json()
     assert data["success"] is False
+
+
+def test_concurrent_task_renders_are_batched(monkeypatch):
+    batches = []
+
+    def fake_create_task_images(tasks, retain_file=True):
+        batches.append([task.name for task in tasks])
+        return [(None, task.name.encode()) for task in tasks]
+
+    monkeypatch.setattr(web_app, "create_task_images", fake_create_task_images)
+
+    async def render_two():
+        return await asyncio.gather(
+            web_app._render_task_batched(SimpleNamespace(name="first")),
+            web_app._render_task_batched(SimpleNamespace(name="second")),
+        )
+
+    results = asyncio.run(render_two())
+
+    assert batches == [["first", "second"]]
+    assert results == [(None, b"first"), (None, b"second")]
+
+
+def test_image_only_prints_decoded_image_at_printer_width(monkeypatch):
+    buf = BytesIO()
+    Image.new("RGB", (100, 50), "red").save(buf, format="PNG")
+    printed = {}
+
+    def fake_print_to_thermal_printer(image_bytes=None):
+        printed["image"] = image_bytes
+
+    monkeypatch.setattr(web_app, "print_to_thermal_printer", fake_print_to_thermal_printer)
+
+    client = TestClient(web_app.app)
+    resp = client.post(
+        "/print",
+        data={"image_only": "on"},
+        files={"attachment": ("photo.png", buf.getvalue(), "image/png")},
+    )
+
+    assert resp.status_code == 200
+    image = printed["image"]
+    assert isinstance(image, Image.Image)
+    assert image.mode == "1"
+    assert image.size == (web_app.get_settings().printer_image_width, web_app.get_settings().printer_image_width // 2)
+
+
+def test_history_serves_bilevel_preview(monkeypatch):
+    buf = BytesIO()
+    Image.new("RGB", (100, 50), "red").save(buf, format="PNG")
+    monkeypatch.setattr(web_app, "print_to_thermal_printer", lambda image_bytes=None: None)
+
+    client = TestClient(web_app.app)
+    client.post(
+        "/print",
+        data={"image_only": "on"},
+        files={"attachment": ("photo.png", buf.getvalue(), "image/png")},
+    )
+    resp = client.get("/history")
+
+    preview_url = resp.json()["items"][0]["preview"]
+    assert preview_url.startswith("/preview/")
+    preview = client.get(preview_url)
+    assert preview.headers["content-type"] == "image/png"
+    assert "immutable" in preview.headers["cache-control"]
+    with Image.open(BytesIO(preview.content)) as thumb:
+        assert thumb.mode == "1"
+        assert thumb.width == web_app.get_settings().printer_image_width
+
+
+def test_bilevel_png_skips_reencode():
+    buf = BytesIO()
+    Image.new("1", (576, 40), 1).save(buf, format="PNG")
+    png = buf.getvalue()
+
+    print_source, image_bytes, preview = web_app._to_grayscale_png(png, 576)
+    assert print_source is png and image_bytes is png
+    assert preview.startswith("data:image/png;base64,")
+
+    print_source, _, _ = web_app._to_grayscale_png(png, 288)
+    assert print_source.size == (288, 20)
+
+
+def test_static_assets_served_gzipped_with_cache_headers():
+    client = TestClient(web_app.app)
+    resp = client.get("/static/js/common.js", headers={"Accept-Encoding": "gzip"})
+    assert resp.status_code == 200
+    assert resp.headers["content-encoding"] == "gzip"
+    assert "max-age" in resp.headers["cache-control"]
+    assert "function escapeHtml" in resp.text
+
+    cached = client.get(
+        "/static/js/common.js",
+        headers={"Accept-Encoding": "gzip", "If-None-Match": resp.headers["etag"]},
+    )
+    assert cached.status_code == 304
+
+
+def test_index_supports_conditional_get():
+    client = TestClient(web_app.app)
+    resp = client.get("/")
+    assert resp.headers["etag"]
+
+    cached = client.get("/", headers={"If-None-Match": resp.headers["etag"]})
+    assert cached.status_code == 304
+
+
+def test_repeated_ticket_skips_rendering(monkeypatch):
+    renders = []
+
+    def fake_create_task_image(task_obj, retain_file=True):
+        renders.append(task_obj.name)
+        return None, b"cachedimagebytes"
+
+    printed = []
+    monkeypatch.setattr(web_app, "create_task_image", fake_create_task_image)
+    monkeypatch.setattr(
+        web_app, "print_to_thermal_printer", lambda image_bytes=None: printed.append(image_bytes)
+    )
+
+    client = TestClient(web_app.app)
+    payload = {"name": "Cached task", "priority": 1, "due_date": "2026-03-01"}
+    assert client.post("/print", json=payload).status_code == 200
+    assert client.post("/print", json=payload).status_code == 200
+
+    assert renders == ["Cached task"]
+    assert printed == [b"cachedimagebytes", b"cachedimagebytes"]
+
+
+def test_oversized_attachment_returns_413(monkeypatch):
+    monkeypatch.setenv("MAX_ATTACHMENT_BYTES", "16")
+    web_app.get_settings.cache_clear()
+    client = TestClient(web_app.app)
+    try:
+        resp = client.post(
+            "/print",
+            data={"image_only": "on"},
+            files={"attachment": ("big.png", b"x" * 64, "image/png")},
+        )
+    finally:
+        web_app.get_settings.cache_clear()
+    assert resp.status_code == 413
+    assert resp.json()["success"] is False
+
+
+def test_print_failure_surfaces_in_history(monkeypatch):
+    monkeypatch.setattr(web_app, "create_task_image", lambda task_obj, retain_file=True: (None, b"jammedbytes"))
+
+    def jammed_printer(image_bytes=None):
+        raise OSError("paper jam")
+
+    monkeypatch.setattr(web_app, "print_to_thermal_printer", jammed_printer)
+
+    client = TestClient(web_app.app)
+    resp = client.post("/print", json={"name": "Jammed", "due_date": "2025-01-03"})
+    assert resp.status_code == 200
+
+    data = client.get("/history").json()
+    assert data["items"][0]["printer_ok"] is False
+    assert "paper jam" in data["items"][0]["error"]
+    assert "paper jam" in data["last_error"]
+
+
+def test_reprint_sends_stored_bytes(monkeypatch):
+    monkeypatch.setattr(web_app, "create_task_image", lambda task_obj, retain_file=True: (None, b"ticketbytes"))
+    printed = []
+    monkeypatch.setattr(web_app, "print_to_thermal_printer", lambda image_bytes=None: printed.append(image_bytes))
+
+    client = TestClient(web_app.app)
+    client.post("/print", json={"name": "Reprint me", "due_date": "2025-01-02"})
+    item = client.get("/history").json()["items"][0]
+    assert item["name"] == "Reprint me"
+    assert "image_bytes" not in item
+
+    resp = client.post("/reprint", json={"id": item["id"]})
+    assert resp.status_code == 200
+    assert printed == [b"ticketbytes", b"ticketbytes"]
+
+    assert client.post("/reprint", json={"id": "nope"}).status_code == 404
+
+
+def test_invalid_due_date_returns_400():
+    client = TestClient(web_app.app)
+    resp = client.post("/print", json={"name": "Bad date", "due_date": "tomorrow"})
+    assert resp.status_code == 400
+    assert resp.json()["success"] is False
+
+
+def test_render_exception_returns_json_500(monkeypatch):
+    def broken_create_task_image(task_obj, retain_file=True):
+        raise RuntimeError("renderer crashed")
+
+    monkeypatch.setattr(web_app, "create_task_image", broken_create_task_image)
+    client = TestClient(web_app.app)
+    resp = client.post("/print", json={"name": "Crash", "due_date": "2025-01-04"})
+    assert resp.status_code == 500
+    assert resp.json()["success"] is False
+
+
+def test_batch_isolates_ticket_with_bad_html(monkeypatch):
+    monkeypatch.setattr(html_generator, "_render_ticket_sheet", lambda html_content: (None, None))
+    monkeypatch.setattr(html_generator, "_render_html", lambda html, retain_file, label: (None, b"png"))
+
+    good = SimpleNamespace(name="good", priority=2, due_date="2031-05-06",
+                           operator_signature="", attachment_bytes=None)
+    bad = SimpleNamespace(name="bad", priority=2, due_date="tomorrow",
+                          operator_signature="", attachment_bytes=None)
+    results = html_generator.create_task_images([bad, good], retain_file=False)
+    assert results == [(None, None), (None, b"png")]
+
+
+def test_file_part_for_text_field_returns_400():
+    client = TestClient(web_app.app)
+    resp = client.post(
+        "/print",
+        data={"due_date": "2025-01-05"},
+        files={"name": ("name.txt", b"not text", "text/plain")},
+    )
+    assert resp.status_code == 400
+    assert resp.json()["success"] is False
+
+
+def test_ticket_cache_keeps_delimiter_lookalikes_apart(monkeypatch):
+    renders = []
+
+    def fake_create_task_image(task_obj, retain_file=True):
+        renders.append((task_obj.name, task_obj.operator_signature))
+        return None, b"renderedbytes"
+
+    monkeypatch.setattr(web_app, "create_task_image", fake_create_task_image)
+    monkeypatch.setattr(web_app, "print_to_thermal_printer", lambda image_bytes=None: None)
+
+    client = TestClient(web_app.app)
+    client.post("/print", json={"name": "a|2|2026-01-01", "due_date": "2026-01-01"})
+    client.post("/print", json={"name": "a", "due_date": "2026-01-01", "operator_signature": "2|2026-01-01|"})
+
+    assert renders == [("a|2|2026-01-01", ""), ("a", "2|2026-01-01|")]
+
+
+def test_history_shows_pending_print_until_job_finishes(monkeypatch):
+    monkeypatch.setattr(web_app, "create_task_image", lambda task_obj, retain_file=True: (None, b"queuedbytes"))
+
+    async def never_finishes(item_id, print_source):
+        pass
+
+    monkeypatch.setattr(web_app, "_print_in_background", never_finishes)
+
+    client = TestClient(web_app.app)
+    assert client.post("/print", json={"name": "Queued", "due_date": "2025-01-06"}).status_code == 200
+
+    item = client.get("/history").json()["items"][0]
+    assert item["name"] == "Queued"
+    assert item["printer_ok"] is None